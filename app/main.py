@@ -1,34 +1,159 @@
+from collections import Counter
+
+
+FIELD_SIZE = 10
+# Number of ships of each length (in decks) required on the field
+SHIP_TYPES = {4: 1, 3: 2, 2: 3, 1: 4}
+# Bitboards: the cell (row, column) is the bit `row * FIELD_SIZE + column`
+BOARD_MASK = (1 << FIELD_SIZE * FIELD_SIZE) - 1
+LEFT_COLUMN_MASK = sum(1 << row * FIELD_SIZE for row in range(FIELD_SIZE))
+RIGHT_COLUMN_MASK = LEFT_COLUMN_MASK << FIELD_SIZE - 1
+
+EMPTY_CELL = "~"
+ALIVE_DECK = "\u25A1"
+HIT_DECK = "*"
+SUNK_DECK = "x"
+COLUMN_COORDINATES = (
+    "\t" + "\t".join(str(column) for column in range(FIELD_SIZE)) + "\n"
+)
+
+
+def get_adjacent_mask(mask: int) -> int:
+    # Spread the cells one step to the sides (without wrapping
+    # to the neighboring row), then one step up and down
+    row = (
+        mask
+        | (mask & ~LEFT_COLUMN_MASK) >> 1
+        | (mask & ~RIGHT_COLUMN_MASK) << 1
+    )
+    spread = row | row << FIELD_SIZE | row >> FIELD_SIZE
+    return spread & BOARD_MASK & ~mask
+
+
 class Deck:
-    def __init__(self, row, column, is_alive=True):
-        pass
+    __slots__ = ("row", "column", "is_alive")
+
+    def __init__(self, row: int, column: int, is_alive: bool = True) -> None:
+        self.row = row
+        self.column = column
+        self.is_alive = is_alive
 
 
 class Ship:
-    def __init__(self, start, end, is_drowned=False):
-        # Create decks and save them to a list `self.decks`
-        pass
+    __slots__ = (
+        "decks", "is_drowned", "_alive_decks", "mask", "adjacent_mask"
+    )
+
+    def __init__(
+            self,
+            start: tuple,
+            end: tuple,
+            is_drowned: bool = False
+    ) -> None:
+        # A ship is straight, so it is on the field if both its ends are
+        for row, column in (start, end):
+            if not (0 <= row < FIELD_SIZE and 0 <= column < FIELD_SIZE):
+                raise ValueError("Ship should be located on the field")
+        # The ends may be given in any order
+        start, end = min(start, end), max(start, end)
+        if start[0] == end[0]:
+            self.decks = [
+                Deck(start[0], column)
+                for column in range(start[1], end[1] + 1)
+            ]
+        elif start[1] == end[1]:
+            self.decks = [
+                Deck(row, start[1]) for row in range(start[0], end[0] + 1)
+            ]
+        else:
+            raise ValueError("Ship should be located in one row or column")
+        self.is_drowned = is_drowned
+        self._alive_decks = len(self.decks)
+        self.mask = sum(
+            1 << deck.row * FIELD_SIZE + deck.column for deck in self.decks
+        )
+        self.adjacent_mask = get_adjacent_mask(self.mask)
 
-    def get_deck(self, row, column):
-        # Find the corresponding deck in the list
-        pass
+    def get_deck(self, row: int, column: int) -> Deck | None:
+        # Decks go one by one along a row or a column,
+        # so the position of a deck is its distance from the first one
+        first = self.decks[0]
+        index = row - first.row + column - first.column
+        if 0 <= index < len(self.decks):
+            deck = self.decks[index]
+            if deck.row == row and deck.column == column:
+                return deck
+        return None
 
-    def fire(self, row, column):
-        # Change the `is_alive` status of the deck
-        # And update the `is_drowned` value if it's needed
-        pass
+    def fire(self, row: int, column: int) -> None:
+        deck = self.get_deck(row, column)
+        if deck.is_alive:
+            deck.is_alive = False
+            self._alive_decks -= 1
+            self.is_drowned = self._alive_decks == 0
 
 
 class Battleship:
-    def __init__(self, ships):
-        # Create a dict `self.field`.
-        # Its keys are tuples - the coordinates of the non-empty cells,
+    __slots__ = ("field", "_cells", "_ships")
+
+    def __init__(self, ships: list) -> None:
+        # `self.field` is a flat list of FIELD_SIZE * FIELD_SIZE cells,
+        # the cell (row, column) is stored at `row * FIELD_SIZE + column`.
         # A value for each cell is a reference to the ship
-        # which is located in it
-        pass
-
-    def fire(self, location: tuple):
-        # This function should check whether the location
-        # is a key in the `self.field`
-        # If it is, then it should check if this cell is the last alive
-        # in the ship or not.
-        pass
+        # which is located in it or None for an empty cell
+        self.field = [None] * FIELD_SIZE * FIELD_SIZE
+        # Symbols printed by `print_field`, laid out like `self.field`
+        # and updated by `fire` only in the cells it changes
+        self._cells = [EMPTY_CELL] * FIELD_SIZE * FIELD_SIZE
+        self._ships = [Ship(start, end) for start, end in ships]
+        for ship in self._ships:
+            for deck in ship.decks:
+                index = deck.row * FIELD_SIZE + deck.column
+                self.field[index] = ship
+                self._cells[index] = ALIVE_DECK
+        self._validate_field()
+
+    def fire(self, location: tuple) -> str:
+        row, column = location
+        if not (0 <= row < FIELD_SIZE and 0 <= column < FIELD_SIZE):
+            raise ValueError("Location should be on the field")
+        index = row * FIELD_SIZE + column
+        ship = self.field[index]
+        if ship is None:
+            return "Miss!"
+        ship.fire(row, column)
+        if ship.is_drowned:
+            for deck in ship.decks:
+                self._cells[deck.row * FIELD_SIZE + deck.column] = SUNK_DECK
+            return "Sunk!"
+        self._cells[index] = HIT_DECK
+        return "Hit!"
+
+    def print_field(self) -> None:
+        cells = self._cells
+        parts = [COLUMN_COORDINATES]
+        for row in range(FIELD_SIZE):
+            parts.append(str(row))
+            for cell in cells[row * FIELD_SIZE:(row + 1) * FIELD_SIZE]:
+                parts.append("\t")
+                parts.append(cell)
+            parts.append("\n")
+        print("".join(parts), end="")
+
+    def _validate_field(self) -> None:
+        if Counter(len(ship.decks) for ship in self._ships) != SHIP_TYPES:
+            raise ValueError(
+                "There should be 1 four-deck, 2 three-deck, "
+                "3 double-deck and 4 single-deck ships"
+            )
+        # Cells taken by the ships placed so far and by their neighbors;
+        # being a neighbor is symmetric, so checking each ship against
+        # the previous ones is enough
+        forbidden = 0
+        for ship in self._ships:
+            if ship.mask & forbidden:
+                raise ValueError(
+                    "Ships shouldn't overlap "
+                    "or be located in the neighboring cells"
+                )
+            forbidden |= ship.mask | ship.adjacent_mask
@@ -1,3 +1,5 @@
+import pytest
+
 from app.main import Battleship
 
 
@@ -28,3 +30,113 @@ def test_battleship():
     assert battle_ship.fire((4, 6)) == "Sunk!"
     assert battle_ship.fire((9, 5)) == "Sunk!"
     assert battle_ship.fire((9, 6)) == "Miss!"
+
+
+SHIPS = [
+    ((2, 0), (2, 3)),
+    ((4, 5), (4, 6)),
+    ((3, 8), (3, 9)),
+    ((6, 0), (8, 0)),
+    ((6, 4), (6, 6)),
+    ((6, 8), (6, 9)),
+    ((9, 9), (9, 9)),
+    ((9, 5), (9, 5)),
+    ((9, 3), (9, 3)),
+    ((9, 7), (9, 7)),
+]
+
+
+def test_repeated_shots_at_a_hit_deck():
+    battle_ship = Battleship(ships=SHIPS)
+    for _ in range(4):
+        assert battle_ship.fire((2, 0)) == "Hit!"
+    assert battle_ship.fire((2, 1)) == "Hit!"
+    assert battle_ship.fire((2, 1)) == "Hit!"
+    assert battle_ship.fire((2, 2)) == "Hit!"
+    assert battle_ship.fire((2, 3)) == "Sunk!"
+
+
+@pytest.mark.parametrize(
+    "ship",
+    [
+        ((3, 1), (3, 1)),
+        ((1, 4), (1, 4)),
+        ((3, 4), (3, 4)),
+        ((1, 2), (1, 2)),
+        ((2, 1), (2, 1)),
+    ]
+)
+def test_overlapping_or_neighboring_ships_are_not_allowed(ship):
+    with pytest.raises(ValueError):
+        Battleship(ships=SHIPS[:-1] + [ship])
+
+
+def test_ships_on_the_field_edges_are_not_neighbors():
+    Battleship(ships=SHIPS[:-1] + [((1, 9), (1, 9))])
+
+
+@pytest.mark.parametrize(
+    "ships",
+    [
+        SHIPS[:-1],
+        SHIPS + [((0, 0), (0, 0))],
+        SHIPS[:-1] + [((0, 0), (0, 1))],
+    ]
+)
+def test_invalid_ship_types_are_not_allowed(ships):
+    with pytest.raises(ValueError):
+        Battleship(ships=ships)
+
+
+def test_diagonal_ships_are_not_allowed():
+    with pytest.raises(ValueError):
+        Battleship(ships=SHIPS[:3] + [((0, 0), (1, 1))] + SHIPS[4:])
+
+
+def test_ship_ends_in_reverse_order():
+    battle_ship = Battleship(ships=[(end, start) for start, end in SHIPS])
+    assert battle_ship.fire((2, 3)) == "Hit!"
+    assert battle_ship.fire((2, 2)) == "Hit!"
+    assert battle_ship.fire((2, 1)) == "Hit!"
+    assert battle_ship.fire((2, 0)) == "Sunk!"
+    assert battle_ship.fire((8, 0)) == "Hit!"
+
+
+@pytest.mark.parametrize(
+    "ship",
+    [
+        ((0, 8), (0, 11)),
+        ((7, 9), (10, 9)),
+        ((-1, 5), (2, 5)),
+        ((0, -3), (0, 0)),
+    ]
+)
+def test_ships_outside_the_field_are_not_allowed(ship):
+    with pytest.raises(ValueError):
+        Battleship(ships=[ship] + SHIPS[1:])
+
+
+@pytest.mark.parametrize(
+    "location",
+    [(-1, 5), (0, -1), (1, 10), (10, 0)]
+)
+def test_fire_outside_the_field_is_not_allowed(location):
+    battle_ship = Battleship(ships=SHIPS)
+    with pytest.raises(ValueError):
+        battle_ship.fire(location)
+
+
+def test_print_field(capsys):
+    battle_ship = Battleship(ships=SHIPS)
+    for column in range(4):
+        battle_ship.fire((2, column))
+    battle_ship.fire((6, 0))
+    battle_ship.fire((9, 5))
+    battle_ship.print_field()
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 11
+    assert lines[0] == "\t0\t1\t2\t3\t4\t5\t6\t7\t8\t9"
+    assert lines[1] == "0" + "\t~" * 10
+    assert lines[3] == "2" + "\tx" * 4 + "\t~" * 6
+    assert lines[7] == "6\t*\t~\t~\t~\t□\t□\t□\t~\t□\t□"
+    assert lines[10] == "9\t~\t~\t~\t□\t~\tx\t~\t□\t~\t□"